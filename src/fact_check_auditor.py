@@ -7,15 +7,100 @@ Maintains persistent audit history log.
 Includes CRITICAL WARNING for elevated risk levels.
 """
 
+import argparse
+import re
+import sys
 from pathlib import Path
 from datetime import datetime
-import re
+from collections import namedtuple
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Optional
+
+
+_SCRIPT_NAME = Path(__file__).name
+
+# Single case-insensitive pattern covering every category; group names map
+# to categories with '_' standing in for spaces. The alternation sits in a
+# zero-width lookahead so a category whose prefix falls inside another
+# category's value is still matched, as with independent searches.
+_ALL_RE = re.compile(
+    r'(?='
+    r'deadline is (?P<Deadline>[^.]+)'
+    r'|lead engineer is (?P<Lead>[^.]+)'
+    r'|budget is (?P<Budget>[^.]+)'
+    r'|risk level:\s*(?P<Risk_Level>[^.]+)'
+    r')',
+    re.IGNORECASE
+)
+
+
+class Status(IntEnum):
+    """Validation outcome for a category."""
+    MATCH = 0
+    MISMATCH = 1
+    DATA_MISSING = 2
+    CRITICAL_WARNING = 3
+
+
+# Display strings indexed by Status
+_STATUS_LABELS = ('MATCH', 'MISMATCH', 'DATA MISSING', 'CRITICAL WARNING')
+
+
+@dataclass(slots=True)
+class AuditResult:
+    """Outcome of validating a single category."""
+    category: str
+    expected: str
+    actual: Optional[str]
+    status: Status
+
+
+# Static sections of the audit report and history log
+_REPORT_HEADER = "=" * 60 + "\nFACT-CHECK AUDIT REPORT\n" + "=" * 60
+_CRITICAL_HEADER = "!!! CRITICAL WARNINGS DETECTED !!!\n" + "=" * 60
+_RESULTS_HEADER = "VALIDATION RESULTS:\n" + "-" * 60
+_HISTORY_HEADER = "=" * 60 + "\nAUDIT HISTORY LOG\n" + "=" * 60 + "\n\n"
+
+
+AuditSummary = namedtuple('AuditSummary', ['matches', 'mismatches', 'missing', 'critical'])
+
+
+def _summarize(results):
+    """Count matches and collect mismatched, missing and critical results in one pass."""
+    matches = 0
+    mismatches = []
+    missing = []
+    critical = []
+    for r in results:
+        status = r.status
+        if status == Status.MATCH:
+            matches += 1
+        elif status == Status.MISMATCH:
+            mismatches.append(r)
+        elif status == Status.DATA_MISSING:
+            missing.append(r)
+        elif status == Status.CRITICAL_WARNING:
+            critical.append(r)
+    return AuditSummary(matches, mismatches, missing, critical)
+
+
+def _console_line(result):
+    """Format the verbose console line for a single result."""
+    label = _STATUS_LABELS[result.status]
+    if result.status == Status.DATA_MISSING:
+        return f"{result.category}: {label}"
+    if result.status == Status.MATCH:
+        return f"{result.category}: {label} ({result.expected})"
+    if result.status == Status.CRITICAL_WARNING:
+        return f"{result.category}: {label} (Expected: {result.expected}, Found: {result.actual.upper()})"
+    return f"{result.category}: {label} (Expected: {result.expected}, Found: {result.actual})"
 
 
 class FactCheckAuditor:
     """A strict fact-checker that validates file content against expected values."""
     
-    def __init__(self):
+    def __init__(self, verbose=False):
         """Initialize with expected values."""
         self.expected_values = {
             'Deadline': 'January 15th',
@@ -23,23 +108,37 @@ class FactCheckAuditor:
             'Budget': '$50,000',
             'Risk Level': 'Low'
         }
+        self._expected_lower = {k: v.lower() for k, v in self.expected_values.items()}
+        self._risk_alert_set = frozenset(('medium', 'high'))
         self.source_file = Path('project_specs.txt')
         self.report_file = Path('audit_report.txt')
         self.history_log = Path('audit_history.log')
         self.content = None
+        self.verbose = verbose
+        self._found = {}
     
     def load_file(self):
         """Load the content from project_specs.txt."""
         try:
-            if not self.source_file.exists():
+            try:
+                with open(self.source_file, 'r', encoding='utf-8') as f:
+                    self.content = f.read()
+            except FileNotFoundError:
                 print(f"Error: File '{self.source_file}' does not exist.")
                 return False
             
-            with open(self.source_file, 'r', encoding='utf-8') as f:
-                self.content = f.read()
+            # Scan the content once for all categories
+            self._found = {}
+            for match in _ALL_RE.finditer(self.content):
+                category = match.lastgroup.replace('_', ' ')
+                # Keep the first occurrence of each category
+                self._found.setdefault(category, match.group(match.lastgroup).strip())
+                if len(self._found) == len(self.expected_values):
+                    break
             
             print(f"✓ Loaded: {self.source_file}")
-            print(f"Content: {self.content}\n")
+            if self.verbose:
+                print(f"Content: {self.content}\n")
             return True
         
         except Exception as e:
@@ -48,41 +147,12 @@ class FactCheckAuditor:
     
     def extract_value(self, category):
         """Extract a specific value from the content."""
-        if not self.content:
-            return None
-        
-        content_lower = self.content.lower()
-        
-        # Search patterns for each category
-        if category == 'Deadline':
-            # Look for deadline date pattern
-            match = re.search(r'deadline is ([^.]+)', content_lower)
-            if match:
-                return match.group(1).strip()
-        
-        elif category == 'Lead':
-            # Look for lead engineer name
-            match = re.search(r'lead engineer is ([^.]+)', content_lower)
-            if match:
-                return match.group(1).strip()
-        
-        elif category == 'Budget':
-            # Look for budget amount
-            match = re.search(r'budget is ([^.]+)', content_lower)
-            if match:
-                return match.group(1).strip()
-        
-        elif category == 'Risk Level':
-            # Look for risk level
-            match = re.search(r'risk level:\s*([^.]+)', content_lower)
-            if match:
-                return match.group(1).strip()
-        
-        return None
+        return self._found.get(category)
     
     def audit(self):
         """Perform the audit and generate report."""
         results = []
+        console_lines = []
         
         print("=" * 60)
         print("AUDIT IN PROGRESS")
@@ -90,104 +160,91 @@ class FactCheckAuditor:
         
         for category, expected in self.expected_values.items():
             actual = self.extract_value(category)
+            actual_lower = actual.lower() if actual is not None else None
             
             if actual is None:
-                status = 'DATA MISSING'
-                print(f"{category}: {status}")
-            elif actual.lower() == expected.lower():
-                status = 'MATCH'
-                print(f"{category}: {status} ({expected})")
+                status = Status.DATA_MISSING
+            elif actual_lower == self._expected_lower[category]:
+                status = Status.MATCH
+            # Check for CRITICAL WARNING on Risk Level
+            elif category == 'Risk Level' and actual_lower in self._risk_alert_set:
+                status = Status.CRITICAL_WARNING
             else:
-                status = 'MISMATCH'
-                
-                # Check for CRITICAL WARNING on Risk Level
-                if category == 'Risk Level' and actual.lower() in ['medium', 'high']:
-                    status = 'CRITICAL WARNING'
-                    print(f"{category}: {status} (Expected: {expected}, Found: {actual.upper()})")
-                else:
-                    print(f"{category}: {status} (Expected: {expected}, Found: {actual})")
+                status = Status.MISMATCH
             
-            results.append({
-                'category': category,
-                'expected': expected,
-                'actual': actual,
-                'status': status
-            })
+            result = AuditResult(category, expected, actual, status)
+            results.append(result)
+            if self.verbose:
+                console_lines.append(_console_line(result))
+        
+        # Per-category detail is also written to the report
+        if self.verbose:
+            sys.stdout.write('\n'.join(console_lines) + '\n')
         
         print("=" * 60)
         return results
     
-    def generate_report(self, results):
+    def generate_report(self, results, summary):
         """Generate the audit_report.txt file."""
-        report_lines = []
-        report_lines.append("=" * 60)
-        report_lines.append("FACT-CHECK AUDIT REPORT")
-        report_lines.append("=" * 60)
-        report_lines.append(f"Source File: {self.source_file}")
-        report_lines.append(f"Report Generated: {Path(__file__).name}")
-        report_lines.append("=" * 60)
-        report_lines.append("")
+        report_lines = [
+            _REPORT_HEADER,
+            f"Source File: {self.source_file}",
+            f"Report Generated: {_SCRIPT_NAME}",
+            "=" * 60,
+            "",
+        ]
         
         # Check for critical warnings
-        critical_warnings = [r for r in results if r['status'] == 'CRITICAL WARNING']
+        critical_warnings = summary.critical
         if critical_warnings:
-            report_lines.append("!!! CRITICAL WARNINGS DETECTED !!!")
-            report_lines.append("=" * 60)
+            report_lines.append(_CRITICAL_HEADER)
             for warning in critical_warnings:
-                report_lines.append(f"⚠️  {warning['category']}: {warning['actual'].upper()}")
-                report_lines.append(f"    Expected: {warning['expected']}")
-            report_lines.append("=" * 60)
-            report_lines.append("")
+                report_lines.append(
+                    f"⚠️  {warning.category}: {warning.actual.upper()}\n"
+                    f"    Expected: {warning.expected}"
+                )
+            report_lines.extend(("=" * 60, ""))
         
-        report_lines.append("VALIDATION RESULTS:")
-        report_lines.append("-" * 60)
+        report_lines.append(_RESULTS_HEADER)
         
         for result in results:
-            report_lines.append(f"\nCategory: {result['category']}")
-            report_lines.append(f"Expected Value: {result['expected']}")
-            
-            if result['actual'] is not None:
-                report_lines.append(f"Actual Value: {result['actual']}")
-            else:
-                report_lines.append(f"Actual Value: NOT FOUND")
-            
-            report_lines.append(f"Status: {result['status']}")
-            report_lines.append("-" * 60)
-        
-        report_lines.append("")
-        report_lines.append("SUMMARY:")
-        matches = sum(1 for r in results if r['status'] == 'MATCH')
-        mismatches = sum(1 for r in results if r['status'] == 'MISMATCH')
-        missing = sum(1 for r in results if r['status'] == 'DATA MISSING')
-        critical = sum(1 for r in results if r['status'] == 'CRITICAL WARNING')
+            actual = result.actual if result.actual is not None else 'NOT FOUND'
+            report_lines.append(
+                f"\nCategory: {result.category}\n"
+                f"Expected Value: {result.expected}\n"
+                f"Actual Value: {actual}\n"
+                f"Status: {_STATUS_LABELS[result.status]}\n"
+                f"{'-' * 60}"
+            )
         
-        report_lines.append(f"  MATCH: {matches}")
-        report_lines.append(f"  MISMATCH: {mismatches}")
-        report_lines.append(f"  CRITICAL WARNING: {critical}")
-        report_lines.append(f"  DATA MISSING: {missing}")
-        report_lines.append("")
-        report_lines.append("=" * 60)
+        report_lines.append(
+            f"\nSUMMARY:\n"
+            f"  MATCH: {summary.matches}\n"
+            f"  MISMATCH: {len(summary.mismatches)}\n"
+            f"  CRITICAL WARNING: {len(summary.critical)}\n"
+            f"  DATA MISSING: {len(summary.missing)}\n"
+            f"\n{'=' * 60}"
+        )
         
         report_content = '\n'.join(report_lines)
         
         try:
-            with open(self.report_file, 'w', encoding='utf-8') as f:
-                f.write(report_content)
+            with open(self.report_file, 'wb') as f:
+                f.write(report_content.encode('utf-8'))
             print(f"\n✓ Report generated: {self.report_file}")
             return True
         except Exception as e:
             print(f"\nError generating report: {e}")
             return False
     
-    def log_to_history(self, results):
+    def log_to_history(self, summary):
         """Append audit results to persistent history log."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        # Calculate summary
-        matches = sum(1 for r in results if r['status'] == 'MATCH')
-        mismatches = [r for r in results if r['status'] == 'MISMATCH']
-        missing = [r for r in results if r['status'] == 'DATA MISSING']
-        critical_warnings = [r for r in results if r['status'] == 'CRITICAL WARNING']
+        matches = summary.matches
+        mismatches = summary.mismatches
+        missing = summary.missing
+        critical_warnings = summary.critical
         
         # Build log entry
         log_entry = []
@@ -199,12 +256,12 @@ class FactCheckAuditor:
         if critical_warnings:
             log_entry.append(f"⚠️  CRITICAL WARNINGS: {len(critical_warnings)}")
             for c in critical_warnings:
-                log_entry.append(f"  - {c['category']}: Expected '{c['expected']}', Found '{c['actual'].upper()}'")
+                log_entry.append(f"  - {c.category}: Expected '{c.expected}', Found '{c.actual.upper()}'")
         
         if mismatches:
             log_entry.append(f"Mismatches Found: {len(mismatches)}")
             for m in mismatches:
-                log_entry.append(f"  - {m['category']}: Expected '{m['expected']}', Found '{m['actual']}'")
+                log_entry.append(f"  - {m.category}: Expected '{m.expected}', Found '{m.actual}'")
         else:
             if not critical_warnings:
                 log_entry.append("Mismatches Found: None")
@@ -212,7 +269,7 @@ class FactCheckAuditor:
         if missing:
             log_entry.append(f"Data Missing: {len(missing)}")
             for m in missing:
-                log_entry.append(f"  - {m['category']}: {m['expected']}")
+                log_entry.append(f"  - {m.category}: {m.expected}")
         
         log_entry.append("-" * 60)
         log_entry.append("")
@@ -221,13 +278,10 @@ class FactCheckAuditor:
         
         try:
             # Append to history log (create if doesn't exist)
-            mode = 'a' if self.history_log.exists() else 'w'
-            with open(self.history_log, mode, encoding='utf-8') as f:
-                if mode == 'w':
-                    f.write("=" * 60 + "\n")
-                    f.write("AUDIT HISTORY LOG\n")
-                    f.write("=" * 60 + "\n\n")
-                f.write(log_content)
+            with open(self.history_log, 'ab') as f:
+                if f.tell() == 0:
+                    log_content = _HISTORY_HEADER + log_content
+                f.write(log_content.encode('utf-8'))
             
             print(f"✓ History logged: {self.history_log}")
             return True
@@ -245,9 +299,10 @@ class FactCheckAuditor:
             return False
         
         results = self.audit()
+        summary = _summarize(results)
         
-        self.generate_report(results)
-        self.log_to_history(results)
+        self.generate_report(results, summary)
+        self.log_to_history(summary)
         
         print("\nAudit complete!")
         return True
@@ -255,7 +310,12 @@ class FactCheckAuditor:
 
 def main():
     """Main function to run the fact-check auditor."""
-    auditor = FactCheckAuditor()
+    parser = argparse.ArgumentParser(description="Validate project_specs.txt against expected values.")
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help="print the loaded content and per-category results")
+    args = parser.parse_args()
+    
+    auditor = FactCheckAuditor(verbose=args.verbose)
     auditor.run()
 
 
@@ -8,13 +8,16 @@ import os
 from pathlib import Path
 
 
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_size(size_bytes):
     """Convert bytes to human-readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit
+    i = min(len(_UNITS) - 1, (size_bytes.bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_UNITS[i]}"
 
 
 def scan_directory(directory_path='.'):
@@ -34,7 +37,8 @@ def scan_directory(directory_path='.'):
     print(f"{'='*60}\n")
     
     # Get all files in the directory
-    files = [f for f in directory.iterdir() if f.is_file()]
+    with os.scandir(directory) as it:
+        files = [entry for entry in it if entry.is_file()]
     
     if not files:
         print("No files found in this directory.")
@@ -43,21 +47,22 @@ def scan_directory(directory_path='.'):
     # Sort files by name
     files.sort(key=lambda x: x.name.lower())
     
-    # Print header
-    print(f"{'File Name':<40} {'Size':>15}")
-    print(f"{'-'*40} {'-'*15}")
+    # Header row
+    lines = [f"{'File Name':<40} {'Size':>15}", f"{'-'*40} {'-'*15}"]
     
     total_size = 0
     
-    # Print each file with its size
-    for file in files:
+    # One row per file with its size
+    for entry in files:
         try:
-            size = file.stat().st_size
-            total_size += size
-            print(f"{file.name:<40} {format_size(size):>15}")
-        except Exception as e:
-            print(f"{file.name:<40} {'Error':>15}")
+            size = entry.stat().st_size
+        except OSError:
+            lines.append(f"{entry.name:<40} {'Error':>15}")
+            continue
+        total_size += size
+        lines.append(f"{entry.name:<40} {format_size(size):>15}")
     
+    print('\n'.join(lines))
     print(f"{'-'*40} {'-'*15}")
     print(f"{'Total:':<40} {format_size(total_size):>15}")
     print(f"\nTotal files: {len(files)}")